@@ -8,5 +8,21 @@ and keyword arguments provided in JSON.
 # Package version (bump as needed)
 __version__ = "0.1.0"
 
-__all__ = ["__version__"]
+__all__ = ["__version__", "main", "estimate_rop_secpar"]
 
+
+def __getattr__(name):
+    # Resolve the public API on first access so 'import lattice_cli' stays cheap.
+    if name == "main":
+        from .cli import main
+
+        return main
+    if name == "estimate_rop_secpar":
+        from .core import estimate_rop_secpar
+
+        return estimate_rop_secpar
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
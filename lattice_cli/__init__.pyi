@@ -0,0 +1,5 @@
+from .cli import main as main
+from .core import estimate_rop_secpar as estimate_rop_secpar
+
+__version__: str
+__all__: list[str]
@@ -3,18 +3,147 @@ import json
 import os
 import sys
 from typing import Any, List, Mapping, Optional
-from .core import estimate_rop_secpar
 from . import __version__
 
+# Bound decode of a single shared decoder; skips json.loads' keyword handling.
+_JSON_DECODE = json.JSONDecoder().decode
 
-def parse_json(value: str, default: Any) -> Any:
-    """Parse a JSON string safely, falling back to a default on empty input."""
-    if value is None or value == "":
-        return default
+# Use the local 'estimator' submodule next to this package, unless
+# LATTICE_CLI_ESTIMATOR_DIR names another directory containing 'estimator/'.
+_REPO_ROOT = os.path.abspath(
+    os.environ.get("LATTICE_CLI_ESTIMATOR_DIR")
+    or os.path.join(os.path.dirname(__file__), os.pardir)
+)
+_ESTIMATOR_DIR = os.path.join(_REPO_ROOT, "estimator")
+# Set once the estimator directory is verified and _REPO_ROOT is on sys.path.
+_PATH_READY = False
+
+
+def _parse_json_dict(value: str) -> dict:
+    """argparse ``type`` that parses a JSON object."""
     try:
-        return json.loads(value)
+        parsed = _JSON_DECODE(value)
     except json.JSONDecodeError as exc:
-        raise SystemExit(f"Invalid JSON: {exc}") from exc
+        raise argparse.ArgumentTypeError(f"Invalid JSON: {exc}") from exc
+    if not isinstance(parsed, dict):
+        raise argparse.ArgumentTypeError("must be a JSON object.")
+    return parsed
+
+
+# estimator's noise-distribution module, imported once on first use.
+_ND = None
+
+
+def _mk_dg(spec: Mapping[str, Any], default_q: Optional[int], ND):
+    stddev = spec.get("stddev")
+    if stddev is None:
+        raise SystemExit("DiscreteGaussian requires 'stddev'.")
+    mean = spec.get("mean", 0)
+    n = spec.get("n", None)
+    return ND.DiscreteGaussian(stddev, mean=mean, n=n)
+
+
+def _mk_dg_alpha(spec: Mapping[str, Any], default_q: Optional[int], ND):
+    alpha = spec.get("alpha")
+    if alpha is None:
+        raise SystemExit("DiscreteGaussianAlpha requires 'alpha'.")
+    q = spec.get("q", default_q)
+    if q is None:
+        raise SystemExit(
+            "DiscreteGaussianAlpha requires 'q' (or provide top-level q)."
+        )
+    mean = spec.get("mean", 0)
+    n = spec.get("n", None)
+    return ND.DiscreteGaussianAlpha(alpha, q, mean=mean, n=n)
+
+
+def _mk_cb(spec: Mapping[str, Any], default_q: Optional[int], ND):
+    eta = spec.get("eta")
+    if eta is None:
+        raise SystemExit("CenteredBinomial requires 'eta'.")
+    n = spec.get("n", None)
+    return ND.CenteredBinomial(eta, n=n)
+
+
+def _mk_uniform(spec: Mapping[str, Any], default_q: Optional[int], ND):
+    a = spec.get("a")
+    b = spec.get("b")
+    if a is None or b is None:
+        raise SystemExit("Uniform requires 'a' and 'b'.")
+    n = spec.get("n", None)
+    return ND.Uniform(a, b, n=n)
+
+
+def _mk_uniform_mod(spec: Mapping[str, Any], default_q: Optional[int], ND):
+    q = spec.get("q", default_q)
+    if q is None:
+        raise SystemExit("UniformMod requires 'q' (or provide top-level q).")
+    n = spec.get("n", None)
+    return ND.UniformMod(q, n=n)
+
+
+def _mk_sparse_ternary(spec: Mapping[str, Any], default_q: Optional[int], ND):
+    p = spec.get("p")
+    m = spec.get("m")
+    if p is None or m is None:
+        raise SystemExit("SparseTernary requires 'p' and 'm'.")
+    n = spec.get("n", None)
+    return ND.SparseTernary(p, m, n)
+
+
+def _mk_sparse_binary(spec: Mapping[str, Any], default_q: Optional[int], ND):
+    hw = spec.get("hw")
+    if hw is None:
+        raise SystemExit("SparseBinary requires 'hw'.")
+    n = spec.get("n", None)
+    return ND.SparseBinary(hw, n)
+
+
+def _mk_binary(spec: Mapping[str, Any], default_q: Optional[int], ND):
+    return ND.Binary
+
+
+def _mk_ternary(spec: Mapping[str, Any], default_q: Optional[int], ND):
+    return ND.Ternary
+
+
+# Every accepted (lower-cased) spelling -> canonical distribution key.
+_ALIAS = {
+    "discretegaussian": "discretegaussian",
+    "dg": "discretegaussian",
+    "gaussian": "discretegaussian",
+    "discretegaussianalpha": "discretegaussianalpha",
+    "dg_alpha": "discretegaussianalpha",
+    "dga": "discretegaussianalpha",
+    "centeredbinomial": "centeredbinomial",
+    "cb": "centeredbinomial",
+    "binomial": "centeredbinomial",
+    "uniform": "uniform",
+    "uniformmod": "uniformmod",
+    "uniform_mod": "uniformmod",
+    "umod": "uniformmod",
+    "sparseternary": "sparseternary",
+    "ternary_sparse": "sparseternary",
+    "st": "sparseternary",
+    "sparsebinary": "sparsebinary",
+    "binary_sparse": "sparsebinary",
+    "sb": "sparsebinary",
+    "binary": "binary",
+    "ternary": "ternary",
+}
+
+# Canonical distribution key -> builder(spec, default_q, ND).
+_BUILDERS = {
+    "discretegaussian": _mk_dg,
+    "discretegaussianalpha": _mk_dg_alpha,
+    "centeredbinomial": _mk_cb,
+    "uniform": _mk_uniform,
+    "uniformmod": _mk_uniform_mod,
+    "sparseternary": _mk_sparse_ternary,
+    "sparsebinary": _mk_sparse_binary,
+    "binary": _mk_binary,
+    "ternary": _mk_ternary,
+}
 
 
 def _build_noise_dist(spec: Mapping[str, Any], default_q: Optional[int] = None):
@@ -32,14 +161,16 @@ def _build_noise_dist(spec: Mapping[str, Any], default_q: Optional[int] = None):
       - Binary: {}
       - Ternary: {}
     """
-    try:
-        from estimator.estimator import nd as ND
-    except Exception as exc:  # pragma: no cover - environment-specific
-        raise SystemExit(
-            "Failed to import estimator's noise distributions. "
-            "Ensure dependencies (e.g., Sage) are installed and importable. "
-            f"Underlying error: {exc}"
-        ) from exc
+    global _ND
+    if _ND is None:
+        try:
+            from estimator.estimator import nd as _ND
+        except Exception as exc:  # pragma: no cover - environment-specific
+            raise SystemExit(
+                "Failed to import estimator's noise distributions. "
+                "Ensure dependencies (e.g., Sage) are installed and importable. "
+                f"Underlying error: {exc}"
+            ) from exc
 
     if not isinstance(spec, dict):
         raise SystemExit("Distribution spec must be a JSON object.")
@@ -47,72 +178,10 @@ def _build_noise_dist(spec: Mapping[str, Any], default_q: Optional[int] = None):
         raise SystemExit("Distribution spec requires a 'name' field.")
 
     name = str(spec["name"]).strip()
-    lname = name.lower()
-
-    if lname in {"discretegaussian", "dg", "gaussian"}:
-        stddev = spec.get("stddev")
-        if stddev is None:
-            raise SystemExit("DiscreteGaussian requires 'stddev'.")
-        mean = spec.get("mean", 0)
-        n = spec.get("n", None)
-        return ND.DiscreteGaussian(stddev, mean=mean, n=n)
-
-    if lname in {"discretegaussianalpha", "dg_alpha", "dga"}:
-        alpha = spec.get("alpha")
-        if alpha is None:
-            raise SystemExit("DiscreteGaussianAlpha requires 'alpha'.")
-        q = spec.get("q", default_q)
-        if q is None:
-            raise SystemExit(
-                "DiscreteGaussianAlpha requires 'q' (or provide top-level q)."
-            )
-        mean = spec.get("mean", 0)
-        n = spec.get("n", None)
-        return ND.DiscreteGaussianAlpha(alpha, q, mean=mean, n=n)
-
-    if lname in {"centeredbinomial", "cb", "binomial"}:
-        eta = spec.get("eta")
-        if eta is None:
-            raise SystemExit("CenteredBinomial requires 'eta'.")
-        n = spec.get("n", None)
-        return ND.CenteredBinomial(eta, n=n)
-
-    if lname in {"uniform"}:
-        a = spec.get("a")
-        b = spec.get("b")
-        if a is None or b is None:
-            raise SystemExit("Uniform requires 'a' and 'b'.")
-        n = spec.get("n", None)
-        return ND.Uniform(a, b, n=n)
-
-    if lname in {"uniformmod", "uniform_mod", "umod"}:
-        q = spec.get("q", default_q)
-        if q is None:
-            raise SystemExit("UniformMod requires 'q' (or provide top-level q).")
-        n = spec.get("n", None)
-        return ND.UniformMod(q, n=n)
-
-    if lname in {"sparseternary", "ternary_sparse", "st"}:
-        p = spec.get("p")
-        m = spec.get("m")
-        if p is None or m is None:
-            raise SystemExit("SparseTernary requires 'p' and 'm'.")
-        n = spec.get("n", None)
-        return ND.SparseTernary(p, m, n)
-
-    if lname in {"sparsebinary", "binary_sparse", "sb"}:
-        hw = spec.get("hw")
-        if hw is None:
-            raise SystemExit("SparseBinary requires 'hw'.")
-        n = spec.get("n", None)
-        return ND.SparseBinary(hw, n)
-
-    if lname in {"binary"}:
-        return ND.Binary
-    if lname in {"ternary"}:
-        return ND.Ternary
-
-    raise SystemExit(f"Unknown distribution type: {name}")
+    canonical = _ALIAS.get(name.lower())
+    if canonical is None:
+        raise SystemExit(f"Unknown distribution type: {name}")
+    return _BUILDERS[canonical](spec, default_q, _ND)
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -133,6 +202,7 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--s-dist",
         required=True,
+        type=_parse_json_dict,
         help=(
             'JSON spec for secret distribution. Example: \'{"name": "DiscreteGaussianAlpha", '
             '"alpha": 0.001, "q": 12289}\''
@@ -141,6 +211,7 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--e-dist",
         required=True,
+        type=_parse_json_dict,
         help=(
             'JSON spec for error distribution. Example: \'{"name": "CenteredBinomial", "eta": 3}\''
         ),
@@ -158,6 +229,11 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Use exact estimation (by default, rough estimation is used).",
     )
+    parser.add_argument(
+        "--json-out",
+        action="store_true",
+        help='Print the result as a JSON object, e.g. {"secpar": 128}.',
+    )
 
     parser.add_argument(
         "--version",
@@ -172,28 +248,25 @@ def main(argv: List[str] | None = None) -> int:
     parser = build_parser()
     ns = parser.parse_args(argv)
 
-    # Always use the local 'estimator' submodule next to this package.
-    repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
-    estimator_dir = os.path.join(repo_root, "estimator")
-    if not os.path.isdir(estimator_dir):
-        print(
-            f"Bundled 'estimator' directory not found at {estimator_dir}",
-            file=sys.stderr,
-        )
-        return 1
-    # Put repository root on sys.path so imports like 'estimator.estimator.nd' resolve.
-    sys.path.insert(0, repo_root)
+    global _PATH_READY
+    if not _PATH_READY:
+        if not os.path.isdir(_ESTIMATOR_DIR):
+            print(
+                f"Bundled 'estimator' directory not found at {_ESTIMATOR_DIR}",
+                file=sys.stderr,
+            )
+            return 1
+        # Put repository root on sys.path so imports like 'estimator.estimator.nd' resolve.
+        if _REPO_ROOT not in sys.path:
+            sys.path.insert(0, _REPO_ROOT)
+        _PATH_READY = True
 
-    # Build noise distributions from JSON specs.
-    s_spec = parse_json(ns.s_dist, default=None)
-    e_spec = parse_json(ns.e_dist, default=None)
-    if not isinstance(s_spec, dict):
-        raise SystemExit("--s-dist must be a JSON object.")
-    if not isinstance(e_spec, dict):
-        raise SystemExit("--e-dist must be a JSON object.")
+    # Deferred so --help/--version never pay for importing the estimator.
+    from .core import estimate_rop_secpar
 
-    s_dist = _build_noise_dist(s_spec, default_q=ns.q)
-    e_dist = _build_noise_dist(e_spec, default_q=ns.q)
+    # Build noise distributions from the JSON specs parsed by argparse.
+    s_dist = _build_noise_dist(ns.s_dist, default_q=ns.q)
+    e_dist = _build_noise_dist(ns.e_dist, default_q=ns.q)
 
     try:
         if ns.m is None:
@@ -209,7 +282,10 @@ def main(argv: List[str] | None = None) -> int:
         print(f"Error while estimating: {exc}", file=sys.stderr)
         return 1
 
-    print(result)
+    if ns.json_out:
+        sys.stdout.write(json.dumps({"secpar": result}) + "\n")
+    else:
+        sys.stdout.write(f"{result}\n")
     return 0
 
 
@@ -1,30 +1,118 @@
-from estimator.estimator import *
-from estimator.estimator.lwe_parameters import *
-from estimator.estimator.nd import *
+from __future__ import annotations
+
+import importlib
 import math
+import numbers
+import os
+from functools import lru_cache
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, Optional
 
+if TYPE_CHECKING:
+    from estimator.estimator.nd import NoiseDistribution
 
-def estimate_rop_secpar(
+# Names resolved from the 'estimator' package on first use. Importing it pulls
+# in Sage, so defer that cost until an estimate is actually requested.
+_LAZY_NAMES = {
+    "LWE": "estimator.estimator",
+    "LWEParameters": "estimator.estimator.lwe_parameters",
+    "NoiseDistribution": "estimator.estimator.nd",
+    "oo": "estimator.estimator.nd",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_NAMES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def _lazy(name: str) -> Any:
+    """Return a lazily imported estimator name (bare lookups skip ``__getattr__``)."""
+    try:
+        return globals()[name]
+    except KeyError:
+        return __getattr__(name)
+
+
+def _estimate_rop_secpar(
     ring_dim: int,
     q: int,
     s_dist: NoiseDistribution,
     e_dist: NoiseDistribution,
-    m: int = oo,
-    is_rough=True,
+    m: Optional[int],
+    is_rough: bool,
 ) -> int:
-    params = LWEParameters(
+    if m is None:
+        m = _lazy("oo")
+    params = _lazy("LWEParameters")(
         ring_dim,
         q,
         s_dist,
         e_dist,
         m,
     )
+    LWE = _lazy("LWE")
     estim = LWE.estimate.rough(params) if is_rough else LWE.estimate(params)
-    vals = estim.values()
-    if len(vals) == 0:
+    # Stream over the attack results once; an empty estimate yields 0.
+    min_rop = min(map(itemgetter("rop"), estim.values()), default=None)
+    if min_rop is None:
         return 0
-    min_rop_log = math.log2(min(val["rop"] for val in vals))
-    if min_rop_log == float("inf"):
+    if isinstance(min_rop, numbers.Integral):
+        # Exact floor(log2) for integers, including those beyond float precision.
+        return max(0, int(min_rop).bit_length() - 1)
+    if math.isinf(min_rop):
         return 4294967295
-    min_secpar = math.floor(min_rop_log)
-    return min_secpar
+    return math.floor(math.log2(min_rop))
+
+
+class _DistKey:
+    """Hashable stand-in for a (mutable, unhashable) NoiseDistribution."""
+
+    __slots__ = ("dist", "key")
+
+    def __init__(self, dist: NoiseDistribution):
+        self.dist = dist
+        try:
+            state = sorted(vars(dist).items())
+        except TypeError:
+            state = dist
+        # repr() of the full state, not of the distribution, which rounds.
+        self.key = (type(dist).__qualname__, repr(state))
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _DistKey) and self.key == other.key
+
+
+@lru_cache(maxsize=256)
+def _estimate_rop_secpar_cached(
+    ring_dim: int,
+    q: int,
+    s_key: _DistKey,
+    e_key: _DistKey,
+    m: Optional[int],
+    is_rough: bool,
+) -> int:
+    return _estimate_rop_secpar(ring_dim, q, s_key.dist, e_key.dist, m, is_rough)
+
+
+def estimate_rop_secpar(
+    ring_dim: int,
+    q: int,
+    s_dist: NoiseDistribution,
+    e_dist: NoiseDistribution,
+    m: Optional[int] = None,
+    is_rough=True,
+) -> int:
+    # Opt-in memoization for repeated calls (sweeps, tests); set LATTICE_CLI_CACHE=1.
+    if os.environ.get("LATTICE_CLI_CACHE") == "1":
+        return _estimate_rop_secpar_cached(
+            ring_dim, q, _DistKey(s_dist), _DistKey(e_dist), m, bool(is_rough)
+        )
+    return _estimate_rop_secpar(ring_dim, q, s_dist, e_dist, m, is_rough)